@@ -0,0 +1,176 @@
+# ============================================
+# Stratos-FEAR Rides - Space Tourism Agency
+# Day 3 Benchmarks - Memory & Planning Speed
+# ============================================
+
+"""
+Measurements behind the Day 3 performance claims.
+
+Run with:  python3 bench_space_agency_day3.py
+"""
+
+import os
+import random
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from space_agency_day3 import Mission, NameTable, RefuelPlanner, Spacecraft
+
+
+# =============================================================================
+# PASSENGER STORAGE MEMORY
+# =============================================================================
+
+MISSIONS = 5
+BOOKINGS_PER_MISSION = 200000
+
+
+def booking_names(scenario, mission_index, count):
+    """Yield passenger names the way each scenario hands them to a booking."""
+    owned = ["Passenger-" + str(i) for i in range(1000)]
+    for i in range(count):
+        if scenario == "caller-owned, repeated":
+            yield owned[i % 1000]
+        elif scenario == "fresh, repeated":
+            yield "Passenger-" + str(i % 1000)
+        else:
+            yield "Passenger-" + str(mission_index) + "-" + str(i)
+
+
+def measure(scenario, use_table):
+    """Return bytes per booking held by the passenger storage."""
+    craft = Spacecraft("Bench Barge", seats=BOOKINGS_PER_MISSION, fuel_capacity=100)
+    sources = [list(booking_names(scenario, m, BOOKINGS_PER_MISSION)) if scenario == "caller-owned, repeated" else None
+               for m in range(MISSIONS)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    table = NameTable() if use_table else None
+    storage = [Mission("Bench " + str(m), "Orbit", 0, name_table=table) for m in range(MISSIONS)]
+    for m, mission in enumerate(storage):
+        mission.spacecraft = craft
+        names = sources[m] or booking_names(scenario, m, BOOKINGS_PER_MISSION)
+        for name in names:
+            mission.add_passenger(name)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / (MISSIONS * BOOKINGS_PER_MISSION)
+
+
+def bench_passenger_memory():
+    """Print per-booking memory for default missions vs missions with a name table."""
+    print("--- PASSENGER STORAGE (", MISSIONS, "missions x", BOOKINGS_PER_MISSION, "bookings ) ---")
+    for scenario in ("caller-owned, repeated", "fresh, repeated", "fresh, unique"):
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            baseline = measure(scenario, use_table=False)
+            table = measure(scenario, use_table=True)
+        print("  %-24s default: %6.1f B/booking | name table: %6.1f B/booking | %5.1fx"
+              % (scenario, baseline, table, baseline / table))
+
+
+# =============================================================================
+# REFUEL PLANNING SPEED
+# =============================================================================
+
+PLANNED_MISSIONS = 100000
+PLANNED_CRAFT = 1000
+ROUNDS = 1000
+
+
+def time_per_round(action):
+    """Return the mean microseconds per call of action over ROUNDS calls."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        action()
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+def bench_refuel_planning():
+    """Print the cost of small plan changes on a large fleet."""
+    rng = random.Random(1)
+    fleet = [Spacecraft("Craft " + str(i), seats=10, fuel_capacity=10 ** 8) for i in range(PLANNED_CRAFT)]
+    missions = [Mission("M" + str(i), "Orbit", rng.randint(0, 10 ** 8)) for i in range(PLANNED_MISSIONS)]
+    for mission in missions:
+        mission.spacecraft = rng.choice(fleet)
+    start = time.perf_counter()
+    planner = RefuelPlanner(10 ** 9, missions)
+    build = time.perf_counter() - start
+
+    solo = Spacecraft("Solo", seats=2, fuel_capacity=10 ** 8)
+    busy = fleet[0]
+    late = Mission("Late Booking", "Orbit", 5 * 10 ** 7)
+
+    def add_cancel(craft):
+        planner.add_mission(late, craft)
+        planner.launchable_count()
+        planner.cancel_mission(late)
+
+    print("--- REFUEL PLANNING (", PLANNED_MISSIONS, "missions on", PLANNED_CRAFT, "spacecraft ) ---")
+    print("  initial build:                  %8.2f s" % build)
+    print("  add + count + cancel, new craft: %7.1f us" % time_per_round(lambda: add_cancel(solo)))
+    print("  add + count + cancel, busy craft: %6.1f us" % time_per_round(lambda: add_cancel(busy)))
+    print("  fuel change on a busy craft:     %7.1f us" % time_per_round(lambda: setattr(busy, "current_fuel", rng.randint(0, 10 ** 8))))
+    print("  launchable_count:                %7.1f us" % time_per_round(planner.launchable_count))
+
+
+# =============================================================================
+# REFUEL PLAN QUALITY
+# =============================================================================
+
+QUALITY_FLEETS = 300
+
+
+def best_launch_count(missions, supply):
+    """Brute-force the most missions a depot can fuel, one top-up per craft."""
+    options = {}
+    for mission, craft in missions:
+        options.setdefault(craft, []).append(mission.fuel_required)
+    best = {0: 0}  # fuel spent -> most missions launched
+    for craft, reqs in options.items():
+        reqs.sort()
+        costs = [max(0, required - craft.current_fuel) for required in reqs]
+        grown = {}
+        for spent, launched in best.items():
+            for k in range(len(costs) + 1):
+                total = spent + (costs[k - 1] if k else 0)
+                if total <= supply and grown.get(total, -1) < launched + k:
+                    grown[total] = launched + k
+        best = grown
+    return max(best.values())
+
+
+def bench_plan_quality():
+    """Print how often the plan matches the brute-force optimum."""
+    rng = random.Random(2)
+    plans = exact = 0
+    worst = 1.0
+    for _ in range(QUALITY_FLEETS):
+        fleet = [Spacecraft("Craft " + str(i), seats=10, fuel_capacity=rng.randint(50, 500)) for i in range(4)]
+        for craft in fleet:
+            craft.current_fuel = rng.randint(0, craft.fuel_capacity)
+        tracked = []
+        for i in range(10):
+            craft = rng.choice(fleet)
+            tracked.append((Mission("M" + str(i), "Orbit", rng.randint(0, craft.fuel_capacity)), craft))
+        planner = RefuelPlanner(0)
+        for mission, craft in tracked:
+            planner.add_mission(mission, craft)
+        for supply in range(0, 1500, 50):
+            planner.depot_supply = supply
+            count = planner.launchable_count()
+            best = best_launch_count(tracked, supply)
+            plans += 1
+            exact += count == best
+            if best:
+                worst = min(worst, count / best)
+    print("--- REFUEL PLAN QUALITY (", plans, "plans, 10 missions on 4 spacecraft ) ---")
+    print("  matches brute-force optimum: %5.1f %%" % (100.0 * exact / plans))
+    print("  worst fraction of optimum:   %5.2f" % worst)
+
+
+if __name__ == "__main__":
+    bench_passenger_memory()
+    print()
+    bench_refuel_planning()
+    print()
+    bench_plan_quality()
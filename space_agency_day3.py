@@ -4,12 +4,160 @@
 # ============================================
 
 """
-Day 3 introduces Object-Oriented Programming with three core classes:
+Day 3 introduces Object-Oriented Programming with the core classes:
+- NameTable: Opt-in, reference-counted table of repeated passenger names
 - CrewMember: Captains, copilots, attendants, and flight ops
 - Spacecraft: Vehicles with capacity, fuel, and assigned crew
 - Mission: Ties together spacecraft, crew, and destinations
+- RefuelPlanner: Shares a finite fuel depot across pending missions
 """
 
+import random
+import sys
+import weakref
+from bisect import bisect_left, bisect_right
+from array import array
+from collections.abc import Sequence
+
+
+def _intern(value):
+    """Intern a name if it is a plain str; leave any other value untouched."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def _id_array(max_id, ids=()):
+    """Return the narrowest unsigned array that can hold IDs up to max_id."""
+    if max_id < 1 << 8:
+        typecode = "B"
+    elif max_id < 1 << 16:
+        typecode = "H"
+    else:
+        typecode = "I"
+    return array(typecode, ids)
+
+
+# =============================================================================
+# NAMETABLE CLASS
+# =============================================================================
+
+class NameTable:
+    """
+    Reference-counted table that stores each distinct name exactly once.
+
+    Missions given a table keep small integer IDs instead of name strings.
+    Each booking takes a reference on its name; when the last booking of
+    a name is cancelled the entry is dropped and its ID is reused, so the
+    table only holds names that are still booked somewhere.
+
+    Only use a table when names repeat across many bookings, such as
+    frequent flyers or group names read fresh from input for every
+    booking. Each distinct name costs a list slot, a dict entry and a
+    refcount, which is far more than the plain list slot a mission uses
+    without a table when every name is unique.
+
+    Attributes:
+        names (list): Names indexed by ID (None for freed IDs)
+        ids (dict): Reverse lookup from name to ID
+        refcounts (array): Number of live bookings for each ID
+    """
+
+    def __init__(self):
+        """Initialize an empty name table."""
+        self.names = []
+        self.ids = {}
+        self.refcounts = array("I")
+        self._free_ids = []
+
+    def intern(self, name):
+        """Return the ID for a str name and take a reference on it."""
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name = sys.intern(name)
+            if self._free_ids:
+                name_id = self._free_ids.pop()
+                self.names[name_id] = name
+            else:
+                name_id = len(self.names)
+                self.names.append(name)
+                self.refcounts.append(0)
+            self.ids[name] = name_id
+        self.refcounts[name_id] += 1
+        return name_id
+
+    def retain(self, name_id):
+        """Take another reference on an ID that is already booked."""
+        self.refcounts[name_id] += 1
+
+    def release(self, name_id):
+        """Drop a reference on an ID, freeing the entry when none are left."""
+        self.refcounts[name_id] -= 1
+        if self.refcounts[name_id] == 0:
+            del self.ids[self.names[name_id]]
+            self.names[name_id] = None
+            self._free_ids.append(name_id)
+
+    def lookup(self, name_id):
+        """Return the name stored under an ID."""
+        return self.names[name_id]
+
+    def max_id(self):
+        """Return the largest ID handed out so far (-1 if none)."""
+        return len(self.names) - 1
+
+    def __len__(self):
+        """Return the number of distinct names currently booked."""
+        return len(self.ids)
+
+
+# =============================================================================
+# PASSENGERLIST CLASS
+# =============================================================================
+
+class PassengerList(Sequence):
+    """
+    Read-only view of a mission's passenger names.
+
+    Names are read from the mission's bookings on access, decoding IDs
+    when the mission uses a name table. The view
+    has no append or item assignment, so mutating it fails loudly; use
+    Mission.add_passenger / remove_passenger, or assign a new list to
+    Mission.passengers.
+    """
+
+    __hash__ = None
+
+    def __init__(self, mission):
+        """Initialize a view over a mission's bookings."""
+        self._mission = mission
+
+    def __getitem__(self, index):
+        """Return a passenger name, or a list of names for a slice."""
+        bookings = self._mission.bookings
+        table = self._mission.name_table
+        if isinstance(index, slice):
+            if table is None:
+                return bookings[index]
+            return [table.lookup(i) for i in bookings[index]]
+        if table is None:
+            return bookings[index]
+        return table.lookup(bookings[index])
+
+    def __len__(self):
+        """Return the number of booked passengers."""
+        return len(self._mission.bookings)
+
+    def __eq__(self, other):
+        """Compare equal to any list, tuple, or view with the same names."""
+        if isinstance(other, (list, tuple, PassengerList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        """Return the names formatted like a list."""
+        return repr(list(self))
+
 
 # =============================================================================
 # CREWMEMBER CLASS
@@ -29,8 +177,8 @@ class CrewMember:
 
     def __init__(self, name, role, experience_level=0):
         """Initialize a new crew member with name, role, and experience."""
-        self.name = name
-        self.role = role
+        self.name = _intern(name)
+        self.role = _intern(role)
         self.experience_level = experience_level
         self.certified = False
         self.assigned_spacecraft = None
@@ -77,13 +225,15 @@ class Spacecraft:
         current_fuel (int): Current fuel level
         ready (bool): Whether craft is ready for launch
         crew (dict): Assigned crew by role
+        fuel_watchers (WeakSet): Planners told whenever current_fuel changes
     """
 
     def __init__(self, name, seats, fuel_capacity):
         """Initialize spacecraft with name, seats, and fuel capacity."""
-        self.name = name
+        self.name = _intern(name)
         self.seats = seats
         self.fuel_capacity = fuel_capacity
+        self.fuel_watchers = weakref.WeakSet()
         self.current_fuel = 0
         self.ready = False
         self.crew = {
@@ -93,6 +243,18 @@ class Spacecraft:
             "flight_ops": None
         }
 
+    @property
+    def current_fuel(self):
+        """Return the current fuel level."""
+        return self._current_fuel
+
+    @current_fuel.setter
+    def current_fuel(self, amount):
+        """Set the fuel level and tell any refuel planners about it."""
+        self._current_fuel = amount
+        for watcher in list(self.fuel_watchers):
+            watcher.refresh_spacecraft(self)
+
     def refuel(self, amount):
         """Add fuel to the spacecraft (up to capacity)."""
         self.current_fuel = min(self.current_fuel + amount, self.fuel_capacity)
@@ -173,19 +335,60 @@ class Mission:
         destination (str): Where we're going
         fuel_required (int): Fuel units needed
         spacecraft (Spacecraft): Assigned spacecraft
-        passengers (list): List of passenger names
+        name_table (NameTable): Optional table of repeated passenger names
+        bookings (list or array): Passenger names, or their IDs in name_table
+        passengers (PassengerList): Read-only view of passenger names
         status (str): planning, ready, launched, or completed
     """
 
-    def __init__(self, name, destination, fuel_required):
-        """Initialize a new mission."""
+    def __init__(self, name, destination, fuel_required, name_table=None):
+        """Initialize a new mission, storing passengers by ID if given a name table."""
         self.name = name
         self.destination = destination
         self.fuel_required = fuel_required
         self.spacecraft = None
-        self.passengers = []
+        self.name_table = name_table
+        self.bookings = [] if name_table is None else _id_array(0)
         self.status = "planning"
 
+    def __copy__(self):
+        """Return a shallow copy with its own bookings and table references."""
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.bookings = self.bookings[:]
+        if self.name_table is not None:
+            for name_id in clone.bookings:
+                self.name_table.retain(name_id)
+        return clone
+
+    @property
+    def passengers(self):
+        """Return a read-only view of the passenger names."""
+        return PassengerList(self)
+
+    @passengers.setter
+    def passengers(self, names):
+        """Replace all bookings with the given names (no seat check)."""
+        names = list(names)
+        if self.name_table is not None:
+            for name in names:
+                if type(name) is not str:
+                    raise TypeError("passenger name must be str with a name table, not " + type(name).__name__)
+        self.clear_passengers()
+        for name in names:
+            self._book(name)
+
+    def _book(self, passenger_name):
+        """Store a booking, widening the ID array if needed."""
+        if self.name_table is None:
+            self.bookings.append(passenger_name)
+            return
+        name_id = self.name_table.intern(passenger_name)
+        ids = self.bookings
+        if name_id >= 1 << (8 * ids.itemsize):
+            ids = self.bookings = _id_array(name_id, ids)
+        ids.append(name_id)
+
     def assign_spacecraft(self, spacecraft):
         """Assign a spacecraft to this mission."""
         if spacecraft.can_handle_mission(self):
@@ -199,13 +402,43 @@ class Mission:
         if self.spacecraft is None:
             print("  [ERROR] No spacecraft assigned yet")
             return False
-        if len(self.passengers) >= self.spacecraft.seats:
-            print("  [ERROR] Mission is full (", len(self.passengers), "/", self.spacecraft.seats, ")")
+        if self.name_table is not None and type(passenger_name) is not str:
+            print("  [ERROR] Passenger name must be str with a name table, not", type(passenger_name).__name__)
+            return False
+        if len(self.bookings) >= self.spacecraft.seats:
+            print("  [ERROR] Mission is full (", len(self.bookings), "/", self.spacecraft.seats, ")")
             return False
-        self.passengers.append(passenger_name)
+        self._book(passenger_name)
         print("  [BOOKED]", passenger_name, "added to", self.name)
         return True
 
+    def remove_passenger(self, passenger_name):
+        """Cancel one booking for a passenger on this mission."""
+        if self.name_table is None:
+            booked = passenger_name in self.bookings
+            key = passenger_name
+        else:
+            key = self.name_table.ids.get(passenger_name) if type(passenger_name) is str else None
+            booked = key is not None and key in self.bookings
+        if not booked:
+            print("  [ERROR]", passenger_name, "is not booked on", self.name)
+            return False
+        del self.bookings[self.bookings.index(key)]
+        if self.name_table is not None:
+            self.name_table.release(key)
+        print("  [CANCELLED]", passenger_name, "removed from", self.name)
+        return True
+
+    def clear_passengers(self):
+        """Cancel every booking, releasing the names from any name table."""
+        if self.name_table is None:
+            self.bookings = []
+            return
+        release = self.name_table.release
+        for name_id in self.bookings:
+            release(name_id)
+        self.bookings = _id_array(0)
+
     def mark_ready(self):
         """Check if mission can be marked ready."""
         if self.spacecraft is None:
@@ -214,7 +447,7 @@ class Mission:
         if not self.spacecraft.ready:
             print("  [ERROR]", self.spacecraft.name, "is not ready")
             return False
-        if len(self.passengers) == 0:
+        if len(self.bookings) == 0:
             print("  [ERROR]", self.name, "has no passengers")
             return False
         self.status = "ready"
@@ -227,7 +460,7 @@ class Mission:
             return "[ABORT] " + self.name + " status is '" + self.status + "', not 'ready'"
         self.status = "launched"
         captain = self.spacecraft.crew["captain"]
-        return "[LAUNCH] " + self.name + "! " + self.spacecraft.name + " commanded by " + captain.name + " with " + str(len(self.passengers)) + " passengers bound for " + self.destination + "!"
+        return "[LAUNCH] " + self.name + "! " + self.spacecraft.name + " commanded by " + captain.name + " with " + str(len(self.bookings)) + " passengers bound for " + self.destination + "!"
 
     def print_summary(self):
         """Print a detailed mission summary."""
@@ -242,8 +475,8 @@ class Mission:
             print("  Spacecraft:", self.spacecraft.name)
         else:
             print("  Spacecraft: Not assigned")
-        if self.passengers:
-            print("  Passengers:", len(self.passengers))
+        if self.bookings:
+            print("  Passengers:", len(self.bookings))
             for p in self.passengers:
                 print("    -", p)
         else:
@@ -251,6 +484,373 @@ class Mission:
         print("=" * 50)
 
 
+# =============================================================================
+# REFUELPLANNER CLASS
+# =============================================================================
+
+class _PlanSegment:
+    """One hull segment of a spacecraft's refuel curve, stored as a treap node."""
+
+    __slots__ = ("key", "priority", "fuel", "count", "craft", "start", "end", "base",
+                 "left", "right", "total_fuel", "total_count", "min_fuel")
+
+    def __init__(self, key, craft, start, end, base, fuel):
+        """Initialize a segment that launches missions start+1..end for fuel more units."""
+        self.key = key
+        self.priority = random.random()
+        self.craft = craft
+        self.start = start
+        self.end = end
+        self.base = base
+        self.fuel = fuel
+        self.count = end - start
+        self.left = None
+        self.right = None
+        self.total_fuel = fuel
+        self.total_count = self.count
+        self.min_fuel = fuel
+
+
+def _pull(node):
+    """Recompute a treap node's subtree totals and cheapest segment from its children."""
+    node.total_fuel = node.fuel
+    node.total_count = node.count
+    node.min_fuel = node.fuel
+    if node.left is not None:
+        node.total_fuel += node.left.total_fuel
+        node.total_count += node.left.total_count
+        node.min_fuel = min(node.min_fuel, node.left.min_fuel)
+    if node.right is not None:
+        node.total_fuel += node.right.total_fuel
+        node.total_count += node.right.total_count
+        node.min_fuel = min(node.min_fuel, node.right.min_fuel)
+
+
+def _split(node, key):
+    """Split a treap into nodes with keys below key and the rest."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _pull(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _pull(node)
+    return left, node
+
+
+def _merge(left, right):
+    """Join two treaps where every key in left is below every key in right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _pull(left)
+        return left
+    right.left = _merge(left, right.left)
+    _pull(right)
+    return right
+
+
+def _delete(node, key):
+    """Remove the node with key from a treap and return the new root."""
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _delete(node.left, key)
+    else:
+        node.right = _delete(node.right, key)
+    _pull(node)
+    return node
+
+
+class RefuelPlanner:
+    """
+    Plans refuels from a finite fuel depot so the most missions can launch.
+
+    A spacecraft is topped up once, to the largest fuel_required among the
+    missions chosen for it, so the k missions a craft can fly cheapest are
+    the k with the lowest requirements. Each craft's (fuel, missions) curve
+    is reduced to its upper convex hull, and the hull segments of the whole
+    fleet are kept in a treap ordered by fuel per mission, with subtree
+    fuel, mission and cheapest-segment totals. The plan:
+
+    1. takes segments in that order while the depot lasts,
+    2. funds what it can part-way along the first segment that does not fit,
+    3. keeps taking later segments that still fit, as long as the craft's
+       earlier segments were all taken,
+    4. funds the craft of that first segment on its own instead, when that
+       alone launches more missions.
+
+    The plan never overspends the depot and is exact when no spacecraft
+    has more than one pending mission. With several missions per craft it
+    is a heuristic: finding the optimum exactly is a knapsack problem.
+
+    Adding, cancelling or refreshing a mission rebuilds only its craft's
+    hull, O(m) for m missions on that craft, and moves only the segments
+    whose shape changed, O(log n) each for n segments fleet-wide.
+    launchable_count is an O(log n) descent plus O(log n) for each later
+    segment the leftover fuel could still pay for.
+    Costs are compared, never used as indices, so any fuel amount works.
+
+    The planner registers in each craft's fuel_watchers (a WeakSet, so a
+    dropped planner stops listening), and any change to current_fuel
+    updates the plan. close() unregisters it explicitly. A change to a
+    mission's fuel_required needs cancel_mission + add_mission.
+
+    Attributes:
+        depot_supply (int): Fuel units left in the depot
+        spacecraft (dict): Spacecraft planned to fly each tracked mission
+    """
+
+    def __init__(self, depot_supply, missions=()):
+        """Initialize the planner with a depot supply and pending missions."""
+        self.depot_supply = depot_supply
+        self.spacecraft = {}
+        self._requirements = {}
+        self._craft_ids = {}
+        self._craft_reqs = {}
+        self._craft_missions = {}
+        self._craft_segments = {}
+        self._craft_ends = {}
+        self._next_craft_id = 0
+        self._root = None
+        for mission in missions:
+            self._track(mission, mission.spacecraft)
+        for craft in list(self._craft_ids):
+            self.refresh_spacecraft(craft)
+
+    @staticmethod
+    def refuel_cost(mission, spacecraft):
+        """Return the fuel a spacecraft needs for a mission, or None if it never can."""
+        if spacecraft is None or mission.fuel_required > spacecraft.fuel_capacity:
+            return None
+        return max(0, mission.fuel_required - spacecraft.current_fuel)
+
+    def add_mission(self, mission, spacecraft=None):
+        """Track a pending mission, flown by its assigned spacecraft by default."""
+        if spacecraft is None:
+            spacecraft = mission.spacecraft
+        if self._track(mission, spacecraft):
+            self.refresh_spacecraft(spacecraft)
+            return True
+        return False
+
+    def _track(self, mission, spacecraft):
+        """Record a mission on its spacecraft without rebuilding the hull."""
+        if mission in self.spacecraft:
+            print("  [ERROR]", mission.name, "is already in the refuel plan")
+            return False
+        if self.refuel_cost(mission, spacecraft) is None:
+            print("  [ERROR]", mission.name, "has no spacecraft that can carry", mission.fuel_required, "fuel")
+            return False
+        if spacecraft not in self._craft_ids:
+            self._craft_ids[spacecraft] = self._next_craft_id
+            self._next_craft_id += 1
+            self._craft_reqs[spacecraft] = []
+            self._craft_missions[spacecraft] = []
+            self._craft_segments[spacecraft] = {}
+            self._craft_ends[spacecraft] = {}
+            spacecraft.fuel_watchers.add(self)
+        required = mission.fuel_required
+        reqs = self._craft_reqs[spacecraft]
+        i = bisect_right(reqs, required)
+        reqs.insert(i, required)
+        self._craft_missions[spacecraft].insert(i, mission)
+        self.spacecraft[mission] = spacecraft
+        self._requirements[mission] = required
+        return True
+
+    def cancel_mission(self, mission):
+        """Stop tracking a mission and release its share of the depot."""
+        if mission not in self.spacecraft:
+            print("  [ERROR]", mission.name, "is not in the refuel plan")
+            return False
+        craft = self.spacecraft.pop(mission)
+        required = self._requirements.pop(mission)
+        reqs = self._craft_reqs[craft]
+        missions = self._craft_missions[craft]
+        i = missions.index(mission, bisect_left(reqs, required))
+        del reqs[i]
+        del missions[i]
+        self.refresh_spacecraft(craft)
+        if not missions:
+            del self._craft_ids[craft]
+            del self._craft_reqs[craft]
+            del self._craft_missions[craft]
+            del self._craft_segments[craft]
+            del self._craft_ends[craft]
+            craft.fuel_watchers.discard(self)
+        return True
+
+    def close(self):
+        """Stop tracking every mission and unregister from their spacecraft."""
+        for craft in self._craft_ids:
+            craft.fuel_watchers.discard(self)
+        self.spacecraft = {}
+        self._requirements = {}
+        self._craft_ids = {}
+        self._craft_reqs = {}
+        self._craft_missions = {}
+        self._craft_segments = {}
+        self._craft_ends = {}
+        self._root = None
+
+    def refresh_spacecraft(self, spacecraft):
+        """Rebuild a spacecraft's hull segments from its current fuel."""
+        if spacecraft not in self._craft_ids:
+            return
+        fuel = spacecraft.current_fuel
+        craft_id = self._craft_ids[spacecraft]
+        # Upper convex hull of (fuel needed, missions launched), from (0, 0)
+        hull = [(0, 0)]
+        for k, required in enumerate(self._craft_reqs[spacecraft], 1):
+            point = (max(0, required - fuel), k)
+            if point[0] == hull[-1][0] and len(hull) > 1:
+                hull.pop()
+            while len(hull) > 1:
+                (x0, y0), (x1, y1) = hull[-2], hull[-1]
+                if (x1 - x0) * (point[1] - y0) - (y1 - y0) * (point[0] - x0) < 0:
+                    break
+                hull.pop()
+            hull.append(point)
+        segments = {}
+        for index in range(1, len(hull)):
+            (x0, y0), (x1, y1) = hull[index - 1], hull[index]
+            segments[((x1 - x0) / (y1 - y0), craft_id, y0, y1, x0)] = x1 - x0
+        # Only segments that changed shape move in the treap
+        old_segments = self._craft_segments[spacecraft]
+        for key in old_segments.keys() - segments.keys():
+            self._root = _delete(self._root, key)
+        for key in segments.keys() - old_segments.keys():
+            segment = _PlanSegment(key, spacecraft, key[2], key[3], key[4], segments[key])
+            left, right = _split(self._root, key)
+            self._root = _merge(_merge(left, segment), right)
+        self._craft_segments[spacecraft] = segments
+        self._craft_ends[spacecraft] = {key[3]: key for key in segments}
+
+    def launchable_count(self):
+        """Return how many tracked missions the depot can fuel."""
+        return self._fit()[0]
+
+    def get_plan(self):
+        """Return a dict of mission -> fuel its spacecraft needs, for the launchable missions."""
+        count, successor, launched, alone = self._fit()
+        if not alone:
+            # Every segment before successor is funded in full
+            prefix = {}
+            stack = []
+            node = self._root
+            while stack or node is not None:
+                if node is not None:
+                    stack.append(node)
+                    node = node.left
+                    continue
+                node = stack.pop()
+                if node is successor:
+                    break
+                prefix[node.craft] = node.end
+                node = node.right
+            prefix.update(launched)
+            launched = prefix
+        plan = {}
+        for craft, k in launched.items():
+            fuel = craft.current_fuel
+            for mission in self._craft_missions[craft][:k]:
+                plan[mission] = max(0, self._requirements[mission] - fuel)
+        return plan
+
+    def apply_plan(self):
+        """Refuel the fleet from the depot according to the current plan."""
+        targets = {}
+        for mission, cost in self.get_plan().items():
+            craft = self.spacecraft[mission]
+            targets[craft] = max(targets.get(craft, 0), cost)
+        drawn = 0
+        for craft, needed in targets.items():
+            if needed > 0:
+                craft.refuel(needed)
+                drawn += needed
+        self.depot_supply -= drawn
+        print("  [DEPOT]", drawn, "units issued,", self.depot_supply, "units remaining")
+        return drawn
+
+    def _fit(self):
+        """Return (count, first segment not fully funded, missions per craft after it, alone)."""
+        node = self._root
+        remaining = self.depot_supply
+        count = 0
+        successor = None
+        # Walk down to the longest run of cheapest segments the depot covers
+        while node is not None:
+            left = node.left
+            if left is not None and left.total_fuel > remaining:
+                successor = node
+                node = left
+                continue
+            if left is not None:
+                remaining -= left.total_fuel
+                count += left.total_count
+            if node.fuel > remaining:
+                successor = node
+                break
+            remaining -= node.fuel
+            count += node.count
+            node = node.right
+        if successor is None:
+            return count, None, {}, False
+
+        # Missions part-way along the next segment may still fit
+        craft = successor.craft
+        fuel = craft.current_fuel
+        reqs = self._craft_reqs[craft]
+        reached = max(successor.start, min(bisect_right(reqs, fuel + successor.base + remaining), successor.end - 1))
+        if reached > successor.start:
+            remaining -= max(0, reqs[reached - 1] - fuel) - successor.base
+            count += reached - successor.start
+        launched = {craft: reached}
+        count += self._fill_after(successor, remaining, launched)
+
+        # Funding the blocked craft on its own can beat the greedy plan
+        alone = bisect_right(reqs, fuel + self.depot_supply)
+        if alone > count:
+            return alone, successor, {craft: alone}, True
+        return count, successor, launched, False
+
+    def _fill_after(self, successor, remaining, launched):
+        """Take whole segments after successor that still fit; return missions added."""
+        key = successor.key
+        stack = []
+        node = self._root
+        while node is not None:
+            if node.key > key:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        added = 0
+        while stack:
+            node = stack.pop()
+            if node.fuel <= remaining:
+                craft = node.craft
+                if craft in launched:
+                    ready = launched[craft] == node.start
+                else:
+                    # Untouched so far: its earlier segment must sit before successor
+                    ready = node.start == 0 or self._craft_ends[craft][node.start] < key
+                if ready:
+                    remaining -= node.fuel
+                    added += node.count
+                    launched[craft] = node.end
+            child = node.right
+            while child is not None and child.min_fuel <= remaining:
+                stack.append(child)
+                child = child.left
+        return added
+
+
 # =============================================================================
 # MAIN SIMULATION
 # =============================================================================
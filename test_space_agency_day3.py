@@ -0,0 +1,343 @@
+"""Tests for the Day 3 classes: run with  python3 -m pytest"""
+
+import copy
+import gc
+import os
+import random
+import tracemalloc
+from contextlib import redirect_stdout
+
+import pytest
+
+from space_agency_day3 import CrewMember, Mission, NameTable, RefuelPlanner, Spacecraft
+
+
+def booked_mission(seats=50, table=None):
+    """Return a mission with a spacecraft assigned and no passengers."""
+    mission = Mission("Test Hop", "Low Earth Orbit", 0, name_table=table)
+    mission.spacecraft = Spacecraft("Test Capsule", seats=seats, fuel_capacity=100)
+    return mission
+
+
+# =============================================================================
+# PASSENGER STORAGE
+# =============================================================================
+
+def test_missions_store_plain_names_by_default():
+    mission = booked_mission()
+    for name in ["Jason", 1, True, 1.0]:
+        assert mission.add_passenger(name)
+    assert mission.name_table is None
+    assert [type(name) for name in mission.passengers] == [str, int, bool, float]
+    assert mission.add_passenger(["not", "hashable"])
+
+
+def test_passenger_ids_round_trip():
+    mission = booked_mission(table=NameTable())
+    for name in ["Jason", "Anthony", "Jason"]:
+        assert mission.add_passenger(name)
+    assert mission.passengers == ["Jason", "Anthony", "Jason"]
+    assert mission.bookings.typecode == "B"
+    assert len(mission.name_table) == 2
+
+
+def test_name_table_only_takes_str_names():
+    mission = booked_mission(table=NameTable())
+    assert not mission.add_passenger(1)
+    assert not mission.add_passenger(True)
+    with pytest.raises(TypeError):
+        mission.passengers = ["Jason", 1.0]
+    assert mission.passengers == []
+
+
+def test_ids_widen_past_one_byte():
+    table = NameTable()
+    for i in range(300):
+        table.intern("Filler-" + str(i))
+    mission = booked_mission(table=table)
+    mission.add_passenger("Jeed")
+    assert mission.bookings.typecode == "H"
+    assert mission.passengers == ["Jeed"]
+
+
+@pytest.mark.parametrize("table", [None, NameTable()])
+def test_passengers_view_is_read_only(table):
+    mission = booked_mission(table=table)
+    mission.add_passenger("Joshua")
+    with pytest.raises(AttributeError):
+        mission.passengers.append("Stowaway")
+    with pytest.raises(TypeError):
+        mission.passengers[0] = "Stowaway"
+    assert mission.passengers == ["Joshua"]
+
+
+def test_passengers_setter_re_encodes():
+    mission = booked_mission(table=NameTable())
+    mission.add_passenger("Joshua")
+    mission.passengers = ["James", "Jeed"]
+    assert mission.passengers == ["James", "Jeed"]
+    assert "Joshua" not in mission.name_table.ids
+
+
+def test_released_names_leave_the_table():
+    table = NameTable()
+    mission = booked_mission(table=table)
+    mission.add_passenger("Jason")
+    mission.add_passenger("Jason")
+    assert mission.remove_passenger("Jason")
+    assert len(table) == 1
+    assert mission.remove_passenger("Jason")
+    assert len(table) == 0
+    assert not mission.remove_passenger("Jason")
+
+    mission.add_passenger("Anthony")
+    assert table.max_id() == 0  # freed ID is reused
+    mission.clear_passengers()
+    assert len(table) == 0
+
+
+def test_copies_keep_their_own_bookings():
+    table = NameTable()
+    original = booked_mission(table=table)
+    original.add_passenger("Jason")
+    clone = copy.copy(original)
+    clone.clear_passengers()
+    del clone
+    gc.collect()
+    original.add_passenger("Anthony")
+    assert original.passengers == ["Jason", "Anthony"]
+
+    deep = copy.deepcopy(original)
+    deep.remove_passenger("Jason")
+    assert original.passengers == ["Jason", "Anthony"]
+    assert deep.passengers == ["Anthony"]
+
+
+def test_non_str_crew_and_craft_names_are_accepted():
+    assert CrewMember(42, "captain").name == 42
+    assert Spacecraft(None, seats=2, fuel_capacity=100).name is None
+
+
+def test_repeated_fresh_names_use_a_tenth_of_the_memory():
+    bookings = 20000
+
+    def held_bytes(store):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        kept = store()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert kept
+        return after - before
+
+    def as_list():
+        return ["Passenger-" + str(i % 100) for i in range(bookings)]
+
+    def as_ids():
+        mission = booked_mission(seats=bookings, table=NameTable())
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            for i in range(bookings):
+                mission.add_passenger("Passenger-" + str(i % 100))
+        return mission
+
+    assert held_bytes(as_ids) * 10 <= held_bytes(as_list)
+
+
+# =============================================================================
+# REFUEL PLANNER
+# =============================================================================
+
+def best_launch_count(missions, supply):
+    """Brute-force the most missions the depot can fuel, one top-up per craft."""
+    reqs_by_craft = {}
+    for mission, craft in missions:
+        reqs_by_craft.setdefault(craft, []).append(mission.fuel_required)
+    crafts = list(reqs_by_craft)
+    best = 0
+
+    def search(index, supply, launched):
+        nonlocal best
+        if index == len(crafts):
+            best = max(best, launched)
+            return
+        craft = crafts[index]
+        reqs = sorted(reqs_by_craft[craft])
+        for k in range(len(reqs) + 1):
+            cost = max(0, reqs[k - 1] - craft.current_fuel) if k else 0
+            if cost <= supply:
+                search(index + 1, supply - cost, launched + k)
+
+    search(0, supply, 0)
+    return best
+
+
+def check_plan(planner, missions, exact=False):
+    """Assert the plan is affordable, consistent and never beats the optimum."""
+    count = planner.launchable_count()
+    plan = planner.get_plan()
+    assert len(plan) == count
+    crafts = dict(missions)
+    top_ups = {}
+    for mission, cost in plan.items():
+        craft = crafts[mission]
+        assert cost == max(0, mission.fuel_required - craft.current_fuel)
+        top_ups[craft] = max(top_ups.get(craft, 0), cost)
+    assert sum(top_ups.values()) <= planner.depot_supply
+    best = best_launch_count(missions, planner.depot_supply)
+    assert count <= best
+    if exact:
+        assert count == best
+    return count, best
+
+
+def test_craft_is_charged_once_for_its_largest_mission():
+    craft = Spacecraft("Heart of Gold", seats=25, fuel_capacity=100)
+    other = Spacecraft("Serenity", seats=8, fuel_capacity=100)
+    missions = [Mission("Loop " + str(i), "Orbit", 10) for i in range(3)]
+    hop = Mission("Hop", "Orbit", 5)
+    planner = RefuelPlanner(10)
+    for mission in missions:
+        planner.add_mission(mission, craft)
+    planner.add_mission(hop, other)
+    assert planner.launchable_count() == 3
+    assert set(planner.get_plan()) == set(missions)
+
+
+def test_later_segments_are_funded_after_one_does_not_fit():
+    big = Spacecraft("Heart of Gold", seats=100, fuel_capacity=100)
+    small = Spacecraft("Serenity", seats=50, fuel_capacity=100)
+    tracked = [(Mission("Big " + str(i), "Orbit", 100), big) for i in range(100)]
+    tracked += [(Mission("Small " + str(i), "Orbit", 99), small) for i in range(50)]
+    planner = RefuelPlanner(99)
+    for mission, craft in tracked:
+        planner.add_mission(mission, craft)
+    assert planner.launchable_count() == 50
+    assert {mission.name[:5] for mission in planner.get_plan()} == {"Small"}
+    check_plan(planner, tracked, exact=True)
+
+
+def test_blocked_craft_is_funded_alone_when_that_launches_more():
+    cheap = Spacecraft("The Panic Capsule", seats=2, fuel_capacity=100)
+    big = Spacecraft("Heart of Gold", seats=100, fuel_capacity=100)
+    tracked = [(Mission("Hop", "Orbit", 1), cheap)]
+    tracked += [(Mission("Big " + str(i), "Orbit", 100), big) for i in range(99)]
+    planner = RefuelPlanner(100)
+    for mission, craft in tracked:
+        planner.add_mission(mission, craft)
+    assert planner.launchable_count() == 99
+    check_plan(planner, tracked, exact=True)
+
+
+def test_plan_tracks_random_adds_cancels_and_refuels():
+    rng = random.Random(7)
+    fleet = [Spacecraft("Craft " + str(i), seats=10, fuel_capacity=rng.randint(50, 500)) for i in range(4)]
+    planner = RefuelPlanner(0)
+    tracked = []
+    for step in range(400):
+        if tracked and rng.random() < 0.4:
+            mission, craft = tracked.pop(rng.randrange(len(tracked)))
+            assert planner.cancel_mission(mission)
+        elif len(tracked) < 10:
+            craft = rng.choice(fleet)
+            mission = Mission("M" + str(step), "Orbit", rng.randint(0, craft.fuel_capacity))
+            assert planner.add_mission(mission, craft)
+            tracked.append((mission, craft))
+        if rng.random() < 0.2:
+            craft = rng.choice(fleet)
+            craft.current_fuel = rng.randint(0, craft.fuel_capacity)
+        planner.depot_supply = rng.randint(0, 1500)
+        check_plan(planner, tracked)
+
+
+def test_bulk_start_matches_one_at_a_time():
+    rng = random.Random(5)
+    fleet = [Spacecraft("Craft " + str(i), seats=10, fuel_capacity=1000) for i in range(5)]
+    tracked = []
+    for i in range(40):
+        mission = Mission("M" + str(i), "Orbit", rng.randint(0, 1000))
+        mission.spacecraft = rng.choice(fleet)
+        tracked.append((mission, mission.spacecraft))
+    bulk = RefuelPlanner(3000, [mission for mission, craft in tracked])
+    stepwise = RefuelPlanner(3000)
+    for mission, craft in tracked:
+        stepwise.add_mission(mission)
+    assert bulk.get_plan() == stepwise.get_plan()
+    check_plan(bulk, tracked)
+
+
+def test_bulk_start_skips_duplicate_missions(capsys):
+    craft = Spacecraft("Serenity", seats=8, fuel_capacity=1000)
+    mission = Mission("Aurora Orbit Experience", "Polar Orbit", 100)
+    mission.spacecraft = craft
+    planner = RefuelPlanner(1000, [mission, mission])
+    assert "already in the refuel plan" in capsys.readouterr().out
+    assert planner.cancel_mission(mission)
+    assert planner.launchable_count() == 0
+    assert planner.get_plan() == {}
+    assert len(craft.fuel_watchers) == 0
+
+
+def test_plan_is_exact_with_one_mission_per_craft():
+    rng = random.Random(11)
+    planner = RefuelPlanner(0)
+    tracked = []
+    for i in range(8):
+        craft = Spacecraft("Solo " + str(i), seats=2, fuel_capacity=1000)
+        craft.current_fuel = rng.randint(0, 500)
+        mission = Mission("Solo " + str(i), "Orbit", rng.randint(0, 1000))
+        planner.add_mission(mission, craft)
+        tracked.append((mission, craft))
+    for supply in range(0, 4000, 97):
+        planner.depot_supply = supply
+        check_plan(planner, tracked, exact=True)
+
+
+def test_refuel_outside_the_planner_updates_the_plan(capsys):
+    craft = Spacecraft("The Black Pearl", seats=5, fuel_capacity=2500)
+    mission = Mission("Aurora Orbit Experience", "Polar Orbit", 1200)
+    planner = RefuelPlanner(0, [])
+    planner.add_mission(mission, craft)
+    assert planner.launchable_count() == 0
+    craft.refuel(1200)
+    assert planner.launchable_count() == 1
+    assert planner.get_plan() == {mission: 0}
+    planner.cancel_mission(mission)
+    assert len(craft.fuel_watchers) == 0
+
+
+def test_dropped_and_closed_planners_stop_watching():
+    craft = Spacecraft("Serenity", seats=8, fuel_capacity=1000)
+    mission = Mission("Aurora Orbit Experience", "Polar Orbit", 100)
+    planners = [RefuelPlanner(1000) for _ in range(3)]
+    for planner in planners:
+        planner.add_mission(mission, craft)
+    assert len(craft.fuel_watchers) == 3
+    del planner
+    del planners[:2]
+    gc.collect()
+    assert len(craft.fuel_watchers) == 1
+    planners[0].close()
+    assert len(craft.fuel_watchers) == 0
+    assert planners[0].launchable_count() == 0
+
+
+def test_apply_plan_draws_from_the_depot(capsys):
+    craft = Spacecraft("Serenity", seats=8, fuel_capacity=4000)
+    planner = RefuelPlanner(3000)
+    for fuel in (1000, 2500, 3500):
+        planner.add_mission(Mission("Run " + str(fuel), "Orbit", fuel), craft)
+    assert planner.apply_plan() == 2500
+    assert craft.current_fuel == 2500
+    assert planner.depot_supply == 500
+    assert planner.launchable_count() == 2
+
+
+def test_fractional_and_huge_fuel_amounts():
+    craft = Spacecraft("Millennium Falcon", seats=10, fuel_capacity=10 ** 8)
+    craft.current_fuel = 10.5
+    planner = RefuelPlanner(40.0)
+    planner.add_mission(Mission("Kessel Run", "Kessel", 50.5), craft)
+    planner.add_mission(Mission("Long Haul", "Deep Space", 5 * 10 ** 7), craft)
+    assert planner.launchable_count() == 1
+    planner.depot_supply = 10 ** 8
+    assert planner.launchable_count() == 2